@@ -17,9 +17,34 @@ Solution:
     then moves outward, guaranteeing the shortest path
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import functools
+import heapq
+import sys
+import numpy as np
 from collections import deque
+from string import Template
+
+# Numba is optional: if it is installed, the BFS search is compiled to fast
+# machine code. Without it the program still works using plain Python.
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# The Cython version of the BFS (robot_bfs.pyx) is used when Numba is not
+# available but the extension has been built. See the README for how.
+try:
+    import robot_bfs
+    HAVE_CYTHON_BFS = True
+except ImportError:
+    HAVE_CYTHON_BFS = False
 
 
 # =============================================
@@ -31,9 +56,36 @@ start = (0, 0)                             # robot starts here
 goal = (3, 3)                              # robot needs to reach here
 obstacles = [(1, 1), (1, 2), (2, 2)]       # cells the robot cannot enter
 
+
+def make_blocked(obstacles, grid_size):
+    """
+    Build the obstacle map: blocked[x + 1, y + 1] is True if (x, y) is an
+    obstacle.
+
+    The map has an extra ring of blocked cells around the real grid, so a
+    step off the edge simply lands on a blocked cell. That way one lookup
+    answers both "is it inside the grid?" and "is it an obstacle?".
+    """
+    blocked = np.ones((grid_size + 2, grid_size + 2), dtype=np.bool_)
+    blocked[1:-1, 1:-1] = False
+    for ox, oy in obstacles:
+        blocked[ox + 1, oy + 1] = True
+    return blocked
+
+
+# Pre-computed obstacle map. Looking up one array cell is much faster than
+# searching the whole obstacles list every time we check a neighbour.
+blocked = make_blocked(obstacles, grid_size)
+
+# The opposite map: SAFE[x + 1, y + 1] is True if the robot may enter (x, y).
+# Worked out once here, so checking a cell never has to recompute it.
+SAFE = ~blocked
+
 # All 8 possible directions the robot can move
 # (change in x, change in y)
-directions = [
+# A tuple, not a list: the directions never change, and Python can treat a
+# tuple of numbers as a fixed constant
+directions = (
     (0, 1),    # up
     (0, -1),   # down
     (-1, 0),   # left
@@ -42,7 +94,20 @@ directions = [
     (-1, 1),   # up-left    (diagonal)
     (1, -1),   # down-right (diagonal)
     (1, 1),    # up-right   (diagonal)
-]
+)
+
+# The same directions flattened into one tuple: dx0, dy0, dx1, dy1, ...
+# Reading two numbers by position is cheaper than unpacking a pair each time.
+DIRS = tuple(d for pair in directions for d in pair)
+
+# The x changes and y changes as two separate tuples, for the compiled
+# bfs() kernel below. Numba copies global tuples into the compiled code.
+DX = tuple(dx for dx, dy in directions)
+DY = tuple(dy for dx, dy in directions)
+
+# The same directions as one contiguous NumPy array (one row per direction),
+# so we can work out all 8 neighbours of a cell in a single step
+OFFSETS = np.array(directions, dtype=np.int8)
 
 
 # =============================================
@@ -52,21 +117,76 @@ directions = [
 def is_safe(x, y):
     """Check if a cell is inside the grid AND not an obstacle."""
 
-    # Check if inside grid boundaries
-    inside_grid = (0 <= x < grid_size) and (0 <= y < grid_size)
+    # Check if inside grid boundaries ((x | y) >= 0 means neither is negative)
+    # and only then look the cell up in the pre-computed obstacle map.
+    # The searches below skip the boundary check: they only ever step one
+    # cell away from the grid, onto the blocked border ring.
+    return (x | y) >= 0 and x < grid_size and y < grid_size and SAFE[x + 1, y + 1]
+
 
-    # Check if NOT an obstacle
-    not_obstacle = (x, y) not in obstacles
+def endpoints_safe(start, goal):
+    """
+    Check that both start and goal are safe cells.
 
-    # Cell is safe only if BOTH conditions are true
-    return inside_grid and not_obstacle
+    The searches below turn (x, y) into a cell number without checking the
+    grid boundaries, so a cell outside the grid could end up as the number
+    of some other cell. Every search calls this first and gives up (returns
+    None) if either end is not safe.
+    """
+    return bool(is_safe(*start) and is_safe(*goal))
 
 
 # =============================================
 # STEP 3: FIND THE SHORTEST PATH USING BFS
 # =============================================
 
-def find_path(start, goal):
+@njit(cache=True)
+def bfs(blocked, start_idx, goal_idx, n):
+    """
+    BFS over cell numbers instead of (x, y) pairs, written so Numba can
+    compile it. Each cell (x, y) is stored as the single number x * n + y.
+
+    Returns came_from: for every cell, the number of the cell we came from
+    (-1 if the cell was never reached).
+    """
+
+    # The queue is a plain array: we read from "head" and write at "tail".
+    # Every cell enters the queue at most once, so n * n slots is enough.
+    queue = np.empty(n * n, np.int32)
+    head = 0
+    tail = 0
+    queue[tail] = start_idx
+    tail += 1
+
+    visited = np.zeros(n * n, np.bool_)
+    visited[start_idx] = True
+    came_from = np.full(n * n, -1, np.int32)
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if current == goal_idx:
+            break
+
+        current_x = current // n
+        current_y = current % n
+
+        for k in range(8):
+            next_x = current_x + DX[k]
+            next_y = current_y + DY[k]
+            # The blocked border ring also keeps us inside the grid
+            if not blocked[next_x + 1, next_y + 1]:
+                next_idx = next_x * n + next_y
+                if not visited[next_idx]:
+                    visited[next_idx] = True
+                    came_from[next_idx] = current
+                    queue[tail] = next_idx
+                    tail += 1
+
+    return came_from
+
+
+def find_path_python(start, goal):
     """
     Use BFS to find the shortest path from start to goal.
 
@@ -79,156 +199,514 @@ def find_path(start, goal):
     6. Trace back to get the full path
     """
 
+    # Both ends must be safe cells inside the grid (see endpoints_safe)
+    if not endpoints_safe(start, goal):
+        return None
+
+    # Each cell (x, y) is stored as a single number. Numbers are cheaper to
+    # store and compare than (x, y) pairs. We number the cells of the obstacle
+    # map including its border ring, which is w = grid_size + 2 cells wide:
+    # cell (x, y) becomes (x + 1) * w + (y + 1).
+    # In that numbering every neighbour is a fixed distance away, e.g. the
+    # cell above is "+ 1" and the cell to the right is "+ w".
+    w = grid_size + 2
+    start_idx = (start[0] + 1) * w + start[1] + 1
+    goal_idx = (goal[0] + 1) * w + goal[1] + 1
+
     # Queue holds cells we still need to explore
     # We start by adding our starting position
     queue = deque()
-    queue.append(start)
+    queue.append(start_idx)
 
     # Keep track of cells we already visited (so we don't revisit them)
-    visited = set()
-    visited.add(start)
+    # visited[idx] is 1 once cell idx has been seen
+    visited = bytearray(w * w)
+    visited[start_idx] = 1
 
     # For each cell, remember which cell we came from
     # This helps us trace the path backwards at the end
-    came_from = {}
-    came_from[start] = None  # start has no parent
+    came_from = [-1] * (w * w)  # -1 means "no parent" (the start)
+
+    # The obstacle map as flat bytes in the same numbering: cell idx is
+    # blocked (an obstacle or the border ring) if blocked_flat[idx] is 1.
+    # Reading bytes is cheaper than a NumPy lookup.
+    blocked_flat = blocked.tobytes()
+
+    # Copy the names used in the loop into local variables.
+    # Python finds local names faster than global names or attributes.
+    _popleft = queue.popleft
+    _append = queue.append
 
     # Keep searching until we run out of cells or find the goal
     while len(queue) > 0:
 
         # Take the next cell from the front of the queue
-        current = queue.popleft()
-        current_x, current_y = current
+        current = _popleft()
 
         # Check: did we reach the goal?
-        if current == goal:
-            print("Goal reached! Now tracing the path back...\n")
+        if current == goal_idx:
 
             # Trace the path backwards from goal to start
             path = []
-            cell = goal
-            while cell is not None:
-                path.append(cell)
+            cell = goal_idx
+            while cell != -1:
+                x, y = divmod(cell, w)
+                path.append((x - 1, y - 1))
                 cell = came_from[cell]
 
             # Reverse it so it goes from start to goal
             path.reverse()
             return path
 
-        # Explore all 8 neighbours around the current cell
-        for dx, dy in directions:
-            next_x = current_x + dx
-            next_y = current_y + dy
-            next_cell = (next_x, next_y)
-
-            # Only visit this neighbour if it's safe and not yet visited
-            if is_safe(next_x, next_y) and next_cell not in visited:
-                visited.add(next_cell)
-                came_from[next_cell] = current
-                queue.append(next_cell)
+        # Explore all 8 neighbours around the current cell, in the same
+        # order as the directions list. The loop is written out by hand
+        # (one block per direction) because that is faster in Python.
+        # Only visit a neighbour if it's safe and not yet visited; the
+        # border ring makes the grid boundary check unnecessary.
+        next_idx = current + 1      # up
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current - 1      # down
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current - w      # left
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current + w      # right
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current - w - 1      # down-left
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current - w + 1      # up-left
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current + w - 1      # down-right
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+
+        next_idx = current + w + 1      # up-right
+        if not blocked_flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
 
     # If we get here, there is no possible path
-    print("No path found!")
     return None
 
 
-# =============================================
-# STEP 4: RUN THE PATHFINDING
-# =============================================
+def find_path_bidirectional(start, goal):
+    """
+    Bidirectional BFS: search from the start AND from the goal at the same
+    time, and stop when the two searches meet in the middle.
 
-print("=" * 50)
-print("   ROBOT PATH PLANNING")
-print("=" * 50)
-print(f"   Grid size  : {grid_size} x {grid_size}")
-print(f"   Start      : {start}")
-print(f"   Goal       : {goal}")
-print(f"   Obstacles  : {obstacles}")
-print("=" * 50)
-print()
-
-# Find the path
-path = find_path(start, goal)
-
-if path is None:
-    print("The robot cannot reach the goal!")
-else:
-    # ----- Print the path -----
-    print("Shortest path found!")
-    print(f"Number of moves: {len(path) - 1}\n")
-
-    for i in range(len(path)):
-        x, y = path[i]
-        if (x, y) == start:
-            label = " <-- START"
-        elif (x, y) == goal:
-            label = " <-- GOAL"
+    Each search only has to go about half the distance, so on big grids it
+    explores far fewer cells than a normal BFS. Moving is allowed in all 8
+    directions both ways, so searching backwards from the goal works exactly
+    like searching forwards.
+    """
+
+    # Both ends must be safe: the goal starts the backward search, so an
+    # obstacle there would otherwise end up on the path
+    if not endpoints_safe(start, goal):
+        return None
+
+    n = grid_size
+    start_idx = start[0] * n + start[1]
+    goal_idx = goal[0] * n + goal[1]
+    if start_idx == goal_idx:
+        return [start]
+
+    # One set of lists for each search: how far each cell is from where that
+    # search started (-1 = not seen yet) and which cell we came from
+    dist_f = [-1] * (n * n)
+    dist_b = [-1] * (n * n)
+    came_from_f = [-1] * (n * n)
+    came_from_b = [-1] * (n * n)
+    dist_f[start_idx] = 0
+    dist_b[goal_idx] = 0
+
+    # The cells each search will expand next (its "frontier")
+    frontier_f = [start_idx]
+    frontier_b = [goal_idx]
+
+    while frontier_f and frontier_b:
+
+        # Always grow the smaller frontier, it is the cheaper one to expand
+        forward = len(frontier_f) <= len(frontier_b)
+        if forward:
+            frontier, dist, came_from, other_dist = (
+                frontier_f, dist_f, came_from_f, dist_b)
         else:
-            label = ""
-        print(f"   Step {i}: ({x}, {y}){label}")
+            frontier, dist, came_from, other_dist = (
+                frontier_b, dist_b, came_from_b, dist_f)
+
+        # Expand one whole layer, remembering the shortest meeting point.
+        # We must finish the layer: the first meeting is not always the best.
+        next_frontier = []
+        best = None
+        best_length = -1
+        for current in frontier:
+            current_x, current_y = divmod(current, n)
+            for k in range(0, 16, 2):
+                next_x = current_x + DIRS[k]
+                next_y = current_y + DIRS[k + 1]
+                if not SAFE[next_x + 1, next_y + 1]:
+                    continue
+                next_idx = next_x * n + next_y
+
+                # Did the other search already reach this cell?
+                if other_dist[next_idx] != -1:
+                    length = dist[current] + 1 + other_dist[next_idx]
+                    if best is None or length < best_length:
+                        best = (current, next_idx)
+                        best_length = length
+
+                if dist[next_idx] == -1:
+                    dist[next_idx] = dist[current] + 1
+                    came_from[next_idx] = current
+                    next_frontier.append(next_idx)
+
+        if best is not None:
+            # Make sure meet_f belongs to the start side, meet_b to the goal side
+            meet_f, meet_b = best if forward else (best[1], best[0])
+
+            # Walk back from the meeting point to the start ...
+            path = []
+            cell = meet_f
+            while cell != -1:
+                path.append(divmod(cell, n))
+                cell = came_from_f[cell]
+            path.reverse()
 
-    # ----- Print the movement log -----
-    print("\n" + "-" * 50)
-    print("   MOVEMENT LOG (what the robot does each step)")
-    print("-" * 50)
+            # ... then forward from the meeting point to the goal
+            cell = meet_b
+            while cell != -1:
+                path.append(divmod(cell, n))
+                cell = came_from_b[cell]
+            return path
 
-    for i in range(len(path) - 1):
-        cx, cy = path[i]           # current position
-        nx, ny = path[i + 1]       # next position
+        if forward:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+
+    # One search ran out of cells before meeting the other: no path exists
+    return None
+
+
+def find_path_astar(start, goal):
+    """
+    A* search: like BFS, but always explore the cell that looks closest to
+    the goal first, instead of exploring evenly in every direction.
+
+    "Looks closest" is measured with the Chebyshev distance
+    max(|goal_x - x|, |goal_y - y|): the number of moves needed if there were
+    no obstacles (a diagonal move counts as 1). It never overestimates the
+    real distance, so A* still finds a shortest path.
+    """
 
-        # Check all 8 neighbours from current position
-        free_cells = []
-        blocked_cells = []
+    # Both ends must be safe cells inside the grid (see endpoints_safe)
+    if not endpoints_safe(start, goal):
+        return None
+
+    n = grid_size
+    goal_x, goal_y = goal
+    start_idx = start[0] * n + start[1]
+    goal_idx = goal_x * n + goal_y
+
+    # g_score[idx] = fewest moves found so far from the start to cell idx
+    # closed[idx] = 1 once cell idx has been fully explored
+    g_score = [n * n] * (n * n)     # n * n is more moves than any real path
+    g_score[start_idx] = 0
+    closed = bytearray(n * n)
+    came_from = [-1] * (n * n)
+
+    # The heap always gives back the entry with the smallest estimate
+    # f = g + h. The counter breaks ties in the order cells were added.
+    counter = 0
+    heap = [(max(abs(goal_x - start[0]), abs(goal_y - start[1])), counter, start_idx)]
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+
+        # A cell can be in the heap more than once; skip the old entries
+        if closed[current]:
+            continue
+        closed[current] = 1
+
+        if current == goal_idx:
+            # Trace the path backwards from goal to start
+            path = []
+            cell = goal_idx
+            while cell != -1:
+                path.append(divmod(cell, n))
+                cell = came_from[cell]
+            path.reverse()
+            return path
+
+        current_x, current_y = divmod(current, n)
+        tentative_g = g_score[current] + 1  # every move costs 1
+
+        for k in range(0, 16, 2):
+            next_x = current_x + DIRS[k]
+            next_y = current_y + DIRS[k + 1]
+            if not SAFE[next_x + 1, next_y + 1]:
+                continue
+            next_idx = next_x * n + next_y
+
+            # Found a shorter way to this neighbour: remember it
+            if tentative_g < g_score[next_idx]:
+                g_score[next_idx] = tentative_g
+                came_from[next_idx] = current
+                h = max(abs(goal_x - next_x), abs(goal_y - next_y))
+                counter += 1
+                heapq.heappush(heap, (tentative_g + h, counter, next_idx))
+
+    # The heap ran empty without reaching the goal: no path exists
+    return None
 
-        for dx, dy in directions:
-            check_x = cx + dx
-            check_y = cy + dy
 
-            if is_safe(check_x, check_y):
-                free_cells.append((check_x, check_y))
-            elif (check_x, check_y) in obstacles:
-                blocked_cells.append((check_x, check_y))
+def find_path_numba(start, goal):
+    """Run the compiled bfs() kernel and turn its result back into a path."""
 
-        print(f"\n   Iteration {i + 1}:")
-        print(f"     Robot is at       : ({cx}, {cy})")
-        print(f"     Free neighbours   : {free_cells}")
-        print(f"     Blocked neighbours: {blocked_cells}")
-        print(f"     Robot moves to    : ({nx}, {ny})")
+    # The compiled kernel does no bounds checking of its own
+    if not endpoints_safe(start, goal):
+        return None
 
-    print(f"\n   Robot arrived at the GOAL {goal}!")
+    start_idx = start[0] * grid_size + start[1]
+    goal_idx = goal[0] * grid_size + goal[1]
+    came_from = bfs(blocked, start_idx, goal_idx, grid_size)
 
+    # The goal was never reached (unless the robot already stands on it)
+    if goal_idx != start_idx and came_from[goal_idx] == -1:
+        return None
 
-    # =============================================
-    # STEP 5: DRAW THE GRID AND PATH (PLOT)
-    # =============================================
+    # Trace the path backwards by following the parent numbers
+    path = []
+    cell = goal_idx
+    while cell != -1:
+        path.append(divmod(int(cell), grid_size))
+        cell = came_from[cell]
+
+    # Reverse it so it goes from start to goal
+    path.reverse()
+    return path
+
+
+def find_path_cython(start, goal):
+    """Run the Cython BFS from robot_bfs.pyx."""
+
+    # Both ends must be safe cells inside the grid (see endpoints_safe)
+    if not endpoints_safe(start, goal):
+        return None
+
+    return robot_bfs.bfs(blocked.view(np.uint8),
+                         start[0], start[1], goal[0], goal[1])
+
+
+@functools.lru_cache(maxsize=1024)
+def _find_path_cached(start, goal):
+    """
+    Search once for each (start, goal) pair and remember the answer.
+
+    The searches read the module-level obstacle maps, so the remembered
+    answers are only valid for the maps they were found on. That is why the
+    obstacles are not part of the key: invalidate_cache() rebuilds the maps
+    and forgets every answer at the same time.
+    """
+
+    if HAVE_NUMBA:
+        path = find_path_numba(start, goal)
+    elif HAVE_CYTHON_BFS:
+        path = find_path_cython(start, goal)
+    else:
+        path = find_path_python(start, goal)
+
+    if path is None:
+        return None
+
+    # Store the path as one (steps, 2) array: column 0 holds the x values,
+    # column 1 the y values. It is made read-only so nobody can change the
+    # remembered path by accident.
+    path = np.asarray(path, dtype=np.int16)
+    path.flags.writeable = False
+    return path
+
+
+def find_path(start, goal):
+    """
+    Find the shortest path from start to goal, or None if there is none.
+    The path is an array with one (x, y) row per step.
+
+    Uses the Numba-compiled BFS when Numba is installed, then the Cython
+    BFS if it has been built, and plain Python otherwise.
+    Asking for the same path again returns the remembered answer straight
+    away; call invalidate_cache() after changing the obstacles or the grid
+    size, or the old answers (and the old obstacle map) keep being used.
+    """
+
+    path = _find_path_cached(tuple(start), tuple(goal))
+
+    if path is None:
+        print("No path found!")
+    else:
+        print("Goal reached! Now tracing the path back...\n")
+    return path
+
+
+def invalidate_cache():
+    """Rebuild the obstacle maps and forget all remembered paths."""
+    global blocked, SAFE
+    blocked = make_blocked(obstacles, grid_size)
+    SAFE = ~blocked
+    _find_path_cached.cache_clear()
+
+
+# Source code template for make_finder(). $NEIGHBOURS and $BLOCKED are
+# filled in before the code is compiled; N and W are constants handed to the
+# compiled code (see make_finder).
+_FINDER_TEMPLATE = Template("""
+def finder(start, goal):
+    # Both ends must be inside the grid and not blocked
+    if not (0 <= start[0] < N and 0 <= start[1] < N
+            and 0 <= goal[0] < N and 0 <= goal[1] < N):
+        return None
+    start_idx = (start[0] + 1) * W + start[1] + 1
+    goal_idx = (goal[0] + 1) * W + goal[1] + 1
+    if start_idx in $BLOCKED or goal_idx in $BLOCKED:
+        return None
+
+    queue = deque([start_idx])
+    visited = bytearray(W * W)
+    visited[start_idx] = 1
+    came_from = [-1] * (W * W)
+    _popleft = queue.popleft
+    _append = queue.append
+
+    while queue:
+        current = _popleft()
+        if current == goal_idx:
+            path = []
+            cell = goal_idx
+            while cell != -1:
+                x, y = divmod(cell, W)
+                path.append((x - 1, y - 1))
+                cell = came_from[cell]
+            path.reverse()
+            return path
+$NEIGHBOURS
+    return None
+""")
+
+_NEIGHBOUR_TEMPLATE = Template("""
+        next_idx = current $OFFSET
+        if next_idx not in $BLOCKED and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            _append(next_idx)
+""")
+
+
+def make_finder(obstacles, grid_size):
+    """
+    Build a BFS path finder made for ONE fixed set of obstacles.
+
+    Useful when the same obstacles are used again and again. Instead of
+    looking cells up in an obstacle map, we write the Python code for a new
+    finder(start, goal) function where the numbers of all blocked cells are
+    typed straight into the code, e.g. "if next_idx not in {5, 6, 10}".
+    Python turns such a set of numbers into a constant once, when the code
+    is compiled, so checking a cell needs no lookup in any outside data.
+
+    The finder works like find_path_python() and returns a list of (x, y)
+    steps, or None if there is no path.
+    """
+
+    # Cell numbers on the map with its border ring (see find_path_python):
+    # the blocked cells are the obstacles plus the whole border ring
+    w = grid_size + 2
+    blocked_ids = {(ox + 1) * w + oy + 1 for ox, oy in obstacles}
+    for i in range(w):
+        blocked_ids.update((i, (w - 1) * w + i, i * w, i * w + w - 1))
+    blocked_literal = "{" + ", ".join(str(idx) for idx in sorted(blocked_ids)) + "}"
+
+    # One neighbour block per direction, in the same order as directions
+    neighbours = ""
+    for dx, dy in directions:
+        offset = dx * w + dy
+        sign = "+" if offset >= 0 else "-"
+        neighbours += _NEIGHBOUR_TEMPLATE.substitute(
+            OFFSET=f"{sign} {abs(offset)}", BLOCKED=blocked_literal)
+
+    source = _FINDER_TEMPLATE.substitute(
+        NEIGHBOURS=neighbours, BLOCKED=blocked_literal)
+
+    # Compile the code and take the new finder function out of it.
+    # N and W never change for this finder, so they are passed in as values.
+    namespace = {"deque": deque, "N": grid_size, "W": w}
+    exec(source, namespace)
+    return namespace["finder"]
+
+
+# =============================================
+# STEP 4: DRAW THE GRID AND PATH (PLOT)
+# =============================================
+
+def render(path, obstacles, start, goal, grid_size, out="robot_path_plot.png"):
+    """Draw the grid, the obstacles and the robot's path, and save it to out."""
+
+    # matplotlib is imported here, not at the top of the file: it is slow to
+    # import and only needed when we actually draw the plot
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    from matplotlib.colors import ListedColormap
+
+    path = np.asarray(path)             # one (x, y) row per step
 
     # Create a figure (the window) and axes (the drawing area)
     fig, ax = plt.subplots(figsize=(8, 8))
     ax.set_title("Robot Path Planning (BFS)", fontsize=16, fontweight="bold")
 
     # --- Draw each cell of the grid ---
+    # The whole grid is drawn as one image with one pixel per cell:
+    # 0 = free cell (light grey), 1 = obstacle (dark blue).
+    # Images are indexed [row, column] = [y, x], so we store cell (x, y)
+    # at image[y, x]; origin="lower" puts row 0 at the bottom.
+    image = np.zeros((grid_size, grid_size), dtype=np.uint8)
+    for ox, oy in obstacles:
+        image[oy, ox] = 1
+
+    ax.imshow(image,
+              cmap=ListedColormap(["#F0F0F0", "#1B2A4A"]),
+              vmin=0, vmax=1,
+              origin="lower",
+              extent=(-0.5, grid_size - 0.5, -0.5, grid_size - 0.5))
+
+    # Write the coordinate label inside each cell
     for x in range(grid_size):
         for y in range(grid_size):
-
-            # Pick color: dark for obstacles, light for free cells
-            if (x, y) in obstacles:
-                color = "#1B2A4A"           # dark blue
-                text_color = "white"
-            else:
-                color = "#F0F0F0"           # light grey
-                text_color = "#444444"
-
-            # Draw a rounded square for this cell
-            square = mpatches.FancyBboxPatch(
-                (x - 0.45, y - 0.45),       # bottom-left corner of square
-                0.9, 0.9,                    # width and height
-                boxstyle="round,pad=0.05",
-                facecolor=color,
-                edgecolor="grey",
-                linewidth=1.2
-            )
-            ax.add_patch(square)
-
-            # Write the coordinate label inside each cell
+            text_color = "white" if image[y, x] else "#444444"
             ax.text(x, y - 0.32, f"({x},{y})",
                     ha="center", va="center",
                     fontsize=8, color=text_color)
@@ -240,10 +718,7 @@ else:
                 fontsize=20, color="#E74C3C", fontweight="bold")
 
     # --- Draw the path as a red line with dots ---
-    path_x = [p[0] for p in path]      # all x-coordinates of the path
-    path_y = [p[1] for p in path]      # all y-coordinates of the path
-
-    ax.plot(path_x, path_y, "-o",
+    ax.plot(path[:, 0], path[:, 1], "-o",  # all x and all y coordinates
             color="#E74C3C",             # red
             linewidth=2.5,
             markersize=12,
@@ -253,8 +728,7 @@ else:
             zorder=5)                    # zorder = draw on top
 
     # --- Add step numbers on each path point ---
-    for i in range(len(path)):
-        x, y = path[i]
+    for i, (x, y) in enumerate(path):
         ax.text(x, y + 0.18, str(i),
                 ha="center", va="center",
                 fontsize=9, fontweight="bold", color="white",
@@ -313,9 +787,95 @@ else:
     ax.set_aspect("equal")              # keep squares looking square
     ax.grid(True, linestyle="--", alpha=0.3)
 
+    # Thin white lines on the cell borders, so the cells stand apart
+    ax.set_xticks(np.arange(-0.5, grid_size), minor=True)
+    ax.set_yticks(np.arange(-0.5, grid_size), minor=True)
+    ax.grid(True, which="minor", color="white", linewidth=3)
+    ax.tick_params(which="minor", length=0)
+
     # --- Save the plot as an image ---
-    plt.tight_layout()
-    plt.savefig("robot_path_plot.png", dpi=150)
-    plt.close()
+    fig.savefig(out, dpi=150, bbox_inches="tight")
+    plt.close(fig)
+
+
+# =============================================
+# STEP 5: RUN THE PATHFINDING
+# =============================================
 
-    print("\nPlot saved as robot_path_plot.png")
\ No newline at end of file
+if __name__ == "__main__":
+
+    print("=" * 50)
+    print("   ROBOT PATH PLANNING")
+    print("=" * 50)
+    print(f"   Grid size  : {grid_size} x {grid_size}")
+    print(f"   Start      : {start}")
+    print(f"   Goal       : {goal}")
+    print(f"   Obstacles  : {obstacles}")
+    print("=" * 50)
+    print()
+
+    # Find the path
+    path = find_path(start, goal)
+
+    if path is None:
+        print("The robot cannot reach the goal!")
+    else:
+        # ----- Work out the path printout and the movement log -----
+        # First find the 8 neighbours of EVERY step at once (one array of
+        # shape steps x 8 x 2), and which of them are free or blocked.
+        # The free-cell map has a blocked border ring, so cells outside the
+        # grid never count as free.
+        neighbours = path[:-1, None, :] + OFFSETS
+        inside_grid = ((neighbours >= 0) & (neighbours < grid_size)).all(axis=2)
+        is_free = SAFE[neighbours[:, :, 0] + 1, neighbours[:, :, 1] + 1]
+        is_blocked = inside_grid & ~is_free
+
+        # Then walk along the path only once, building the lines for both
+        # the path printout and the movement log as we go.
+        # All lines are written out in one go at the end: one big write is
+        # much cheaper than many small print() calls.
+        cells = [tuple(cell) for cell in path.tolist()]
+        neighbours = neighbours.tolist()
+        is_free = is_free.tolist()
+        is_blocked = is_blocked.tolist()
+        step_lines = []
+        log_lines = []
+
+        for i, (x, y) in enumerate(cells):
+            if (x, y) == start:
+                label = " <-- START"
+            elif (x, y) == goal:
+                label = " <-- GOAL"
+            else:
+                label = ""
+            step_lines.append(f"   Step {i}: ({x}, {y}){label}")
+
+            # The last cell is the goal: there is no move left to log
+            if i == len(cells) - 1:
+                break
+
+            free_cells = [tuple(cell) for cell, free in zip(neighbours[i], is_free[i]) if free]
+            blocked_cells = [tuple(cell) for cell, bad in zip(neighbours[i], is_blocked[i]) if bad]
+
+            log_lines.append(f"\n   Iteration {i + 1}:")
+            log_lines.append(f"     Robot is at       : ({x}, {y})")
+            log_lines.append(f"     Free neighbours   : {free_cells}")
+            log_lines.append(f"     Blocked neighbours: {blocked_cells}")
+            log_lines.append(f"     Robot moves to    : {cells[i + 1]}")
+
+        log_lines.append(f"\n   Robot arrived at the GOAL {goal}!")
+
+        # ----- Print the path -----
+        print("Shortest path found!")
+        print(f"Number of moves: {len(path) - 1}\n")
+        sys.stdout.write("\n".join(step_lines) + "\n")
+
+        # ----- Print the movement log -----
+        print("\n" + "-" * 50)
+        print("   MOVEMENT LOG (what the robot does each step)")
+        print("-" * 50)
+        sys.stdout.write("\n".join(log_lines) + "\n")
+
+        # Draw the grid and path (see STEP 4 above)
+        render(path, obstacles, start, goal, grid_size)
+        print("\nPlot saved as robot_path_plot.png")
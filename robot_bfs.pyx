@@ -0,0 +1,146 @@
+# cython: language_level=3
+"""
+Compiled BFS for robot.py, for computers where Numba is not available.
+
+Build it once with:
+
+    pip install cython
+    cythonize -i robot_bfs.pyx
+
+robot.py uses it automatically when the compiled module can be imported,
+and falls back to plain Python otherwise.
+"""
+
+cimport cython
+import numpy as np
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def bfs(unsigned char[:, ::1] blocked, int sx, int sy, int gx, int gy):
+    """
+    Find the shortest path from (sx, sy) to (gx, gy) with BFS.
+
+    blocked is the padded obstacle map from robot.make_blocked() viewed as
+    bytes: blocked[x + 1, y + 1] is 1 if (x, y) is an obstacle, and the
+    outer ring is always 1. Returns an (L, 2) array of (x, y) steps, or
+    None if the goal cannot be reached or either end is outside the grid.
+    """
+
+    # Bounds checking is switched off below, so an end outside the grid
+    # would write past the buffers: give up before touching any of them
+    cdef int nx = blocked.shape[0] - 2
+    cdef int ny = blocked.shape[1] - 2
+    if not (0 <= sx < nx and 0 <= gx < nx and 0 <= sy < ny and 0 <= gy < ny):
+        return None
+
+    # Cells are numbered on the padded map, which is w cells wide:
+    # (x, y) becomes (x + 1) * w + (y + 1). Every neighbour is then a fixed
+    # distance away, and the blocked ring keeps the search inside the grid.
+    cdef int w = blocked.shape[1]
+    cdef int size = blocked.shape[0] * w
+    cdef const unsigned char[::1] flat = np.asarray(blocked).reshape(-1)
+    cdef int start_idx = (sx + 1) * w + sy + 1
+    cdef int goal_idx = (gx + 1) * w + gy + 1
+
+    # Every cell enters the queue at most once, so "size" slots are enough:
+    # head only ever moves forward and the buffer never has to wrap around
+    queue_arr = np.empty(size, dtype=np.intc)
+    visited_arr = np.zeros(size, dtype=np.uint8)
+    came_from_arr = np.full(size, -1, dtype=np.intc)
+    cdef int[::1] queue = queue_arr
+    cdef unsigned char[::1] visited = visited_arr
+    cdef int[::1] came_from = came_from_arr
+
+    cdef int head = 0
+    cdef int tail = 0
+    cdef int current, next_idx, cell, length
+    cdef bint found = False
+
+    queue[tail] = start_idx
+    tail += 1
+    visited[start_idx] = 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+        if current == goal_idx:
+            found = True
+            break
+
+        # The 8 neighbours, in the same order as robot.directions
+        next_idx = current + 1          # up
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current - 1          # down
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current - w          # left
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current + w          # right
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current - w - 1      # down-left
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current - w + 1      # up-left
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current + w - 1      # down-right
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+        next_idx = current + w + 1      # up-right
+        if not flat[next_idx] and not visited[next_idx]:
+            visited[next_idx] = 1
+            came_from[next_idx] = current
+            queue[tail] = next_idx
+            tail += 1
+
+    if not found:
+        return None
+
+    # Count the steps, then fill the path in from the goal backwards
+    length = 0
+    cell = goal_idx
+    while cell != -1:
+        length += 1
+        cell = came_from[cell]
+
+    path_arr = np.empty((length, 2), dtype=np.intc)
+    cdef int[:, ::1] path = path_arr
+    cell = goal_idx
+    while cell != -1:
+        length -= 1
+        path[length, 0] = cell // w - 1
+        path[length, 1] = cell % w - 1
+        cell = came_from[cell]
+    return path_arr